@@ -2,8 +2,21 @@
 
 This package exposes the :class:`Subscription` and :class:`SubscriptionManager`
 classes for easy import. It has no side effects when imported.
-"""
 
-from .subscription import Subscription, SubscriptionManager  # noqa: F401
+The classes are resolved lazily via PEP 562 module ``__getattr__`` so that
+``import subscription_manager`` itself stays cheap; the ``subscription``
+module (and its ``datetime`` import) is only loaded on first attribute
+access. This keeps startup fast for short CLI invocations.
+"""
 
 __all__ = ["Subscription", "SubscriptionManager"]
+
+
+# Annotated as object rather than typing.Any: importing typing here would
+# cost more than the lazy indirection saves.
+def __getattr__(name: str) -> object:
+    if name in __all__:
+        from . import subscription
+
+        return getattr(subscription, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
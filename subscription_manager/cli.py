@@ -10,6 +10,11 @@ Run the script directly to start the interactive prompt, e.g.::
 
     python -m subscription_manager.cli
 
+For bulk loading, the ``import-csv`` subcommand reads a CSV file of
+``name,cost,renewal_date`` rows without any interactive prompting::
+
+    python -m subscription_manager.cli import-csv subscriptions.csv
+
 The underlying logic uses the :class:`subscription_manager.Subscription`
 and :class:`subscription_manager.SubscriptionManager` classes. See the
 ``README.md`` for more details on the subscription management API.
@@ -17,8 +22,10 @@ and :class:`subscription_manager.SubscriptionManager` classes. See the
 
 from __future__ import annotations
 
+import argparse
+import csv
 import datetime
-from typing import Optional
+from typing import List, Optional
 
 from . import Subscription, SubscriptionManager
 
@@ -26,6 +33,13 @@ from . import Subscription, SubscriptionManager
 def parse_date(date_str: str) -> datetime.date:
     """Parse a date string in YYYY‑MM‑DD format into a ``datetime.date``.
 
+    The fixed format is parsed by slicing rather than ``strptime``, which
+    drags in regex and locale machinery for every call. The length,
+    separator and digit checks up front keep the strict-format
+    ``ValueError`` contract — ``int()`` alone would accept signs and
+    surrounding whitespace — and ``datetime.date`` itself rejects
+    out-of-range fields.
+
     Parameters
     ----------
     date_str: str
@@ -41,24 +55,36 @@ def parse_date(date_str: str) -> datetime.date:
     ValueError
         If the date string is not in the expected format.
     """
-    return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+    if (
+        len(date_str) != 10
+        or date_str[4] != "-"
+        or date_str[7] != "-"
+        or not (date_str[0:4] + date_str[5:7] + date_str[8:10]).isdecimal()
+    ):
+        raise ValueError(f"Invalid date format: {date_str!r}. Expected YYYY-MM-DD.")
+    return datetime.date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
 
 
 def add_subscription(manager: SubscriptionManager) -> None:
-    """Prompt the user to add a new subscription and add it to the manager."""
+    """Prompt the user to add a new subscription and add it to the manager.
+
+    All three prompts are read first, then the answers are validated
+    cheapest-first (date format, then cost, then name uniqueness), so an
+    invalid answer never wastes the more expensive later checks.
+    """
     name = input("Enter subscription name: ").strip()
-    try:
-        cost_str = input("Enter monthly cost (e.g. 9.99): ").strip()
-        cost = float(cost_str)
-    except ValueError:
-        print("Invalid cost. Please enter a numeric value.")
-        return
+    cost_str = input("Enter monthly cost (e.g. 9.99): ").strip()
     date_input = input("Enter renewal date (YYYY‑MM‑DD): ").strip()
     try:
         renewal_date = parse_date(date_input)
     except ValueError:
         print("Invalid date format. Please use YYYY‑MM‑DD.")
         return
+    try:
+        cost = float(cost_str)
+    except ValueError:
+        print("Invalid cost. Please enter a numeric value.")
+        return
     try:
         manager.add_subscription(Subscription(name=name, cost=cost, renewal_date=renewal_date))
         print(f"Subscription '{name}' added successfully.")
@@ -89,6 +115,9 @@ def list_subscriptions(manager: SubscriptionManager, active_only: bool = False)
 
 def auto_cancel(manager: SubscriptionManager) -> None:
     """Prompt the user for a date and auto‑cancel due subscriptions."""
+    if not manager.list_subscriptions(active_only=True):
+        print("No active subscriptions to cancel.")
+        return
     date_input = input("Enter today's date (YYYY‑MM‑DD): ").strip()
     try:
         today = parse_date(date_input)
@@ -100,19 +129,25 @@ def auto_cancel(manager: SubscriptionManager) -> None:
 
 
 def renew_subscription(manager: SubscriptionManager) -> None:
-    """Prompt the user to renew a cancelled subscription."""
+    """Prompt the user to renew a cancelled subscription.
+
+    The name is checked for existence before the date prompt, so a typo'd
+    name is reported immediately instead of after another question.
+    """
     name = input("Enter subscription name to renew: ").strip()
+    try:
+        manager.get_subscription(name)
+    except KeyError:
+        print(f"Subscription '{name}' does not exist.")
+        return
     date_input = input("Enter today's date (YYYY‑MM‑DD): ").strip()
     try:
         today = parse_date(date_input)
     except ValueError:
         print("Invalid date format. Please use YYYY‑MM‑DD.")
         return
-    try:
-        manager.renew_subscription(name, today=today)
-        print(f"Subscription '{name}' renewed. Next renewal date: {manager.get_subscription(name).renewal_date}.")
-    except KeyError:
-        print(f"Subscription '{name}' does not exist.")
+    manager.renew_subscription(name, today=today)
+    print(f"Subscription '{name}' renewed. Next renewal date: {manager.get_subscription(name).renewal_date}.")
 
 
 def show_totals(manager: SubscriptionManager) -> None:
@@ -123,9 +158,55 @@ def show_totals(manager: SubscriptionManager) -> None:
     print(f"Total monthly savings from cancelled subscriptions: ${savings:.2f}")
 
 
-def main() -> None:
-    """Main interactive loop for the CLI."""
-    manager = SubscriptionManager()
+def import_csv(manager: SubscriptionManager, path: str) -> int:
+    """Bulk import subscriptions from a CSV file.
+
+    Each row must contain ``name, cost, renewal_date`` with the date in
+    ISO format (YYYY‑MM‑DD). Blank rows are skipped. All rows are parsed
+    before anything is added, and the whole batch goes through
+    :meth:`SubscriptionManager.add_many`, so a bad row leaves the manager
+    unchanged.
+
+    Parameters
+    ----------
+    manager: SubscriptionManager
+        Manager to add the subscriptions to.
+    path: str
+        Path to the CSV file.
+
+    Returns
+    -------
+    int
+        Number of subscriptions imported.
+
+    Raises
+    ------
+    ValueError
+        If a row is malformed or a name is duplicated.
+    OSError
+        If the file cannot be read.
+    """
+    subs = []
+    with open(path, newline="") as handle:
+        for row in csv.reader(handle):
+            if not row:
+                continue
+            if len(row) != 3:
+                raise ValueError(f"Expected 3 columns (name, cost, renewal_date), got {row!r}.")
+            name, cost_str, date_str = row
+            subs.append(
+                Subscription(
+                    name=name.strip(),
+                    cost=float(cost_str),
+                    renewal_date=parse_date(date_str.strip()),
+                )
+            )
+    manager.add_many(subs)
+    return len(subs)
+
+
+def run_interactive(manager: SubscriptionManager) -> None:
+    """Run the interactive menu loop against ``manager``."""
     actions = {
         "1": ("Add subscription", add_subscription),
         "2": ("Remove subscription", remove_subscription),
@@ -153,5 +234,30 @@ def main() -> None:
             func(manager)
 
 
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point: dispatch to a subcommand or the interactive loop."""
+    parser = argparse.ArgumentParser(
+        prog="subscription-manager",
+        description="Manage subscriptions from the command line.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    import_parser = subparsers.add_parser(
+        "import-csv",
+        help="Bulk import subscriptions from a CSV of name,cost,renewal_date rows.",
+    )
+    import_parser.add_argument("path", help="Path to the CSV file to import.")
+    args = parser.parse_args(argv)
+    manager = SubscriptionManager()
+    if args.command == "import-csv":
+        try:
+            count = import_csv(manager, args.path)
+        except (ValueError, OSError) as exc:
+            parser.exit(1, f"{exc}\n")
+        print(f"Imported {count} subscriptions from {args.path}.")
+        show_totals(manager)
+        return
+    run_interactive(manager)
+
+
 if __name__ == "__main__":
     main()
@@ -21,11 +21,19 @@ cancellations unless an override is provided for testing.
 from __future__ import annotations
 
 import datetime
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+import sys
+from array import array
+from bisect import bisect_right, insort
+from itertools import compress, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+#: Renewal period used by :meth:`Subscription.renew`. Months are
+#: approximated as 30 days; precomputed once so renew() does not
+#: construct a fresh timedelta per call.
+_ONE_MONTH = datetime.timedelta(days=30)
+_ONE_MONTH_DAYS = 30
 
 
-@dataclass
 class Subscription:
     """Represents a single subscription.
 
@@ -38,15 +46,55 @@ class Subscription:
     renewal_date: datetime.date
         The date on which the subscription will renew. Subscriptions renew
         monthly, so this date is updated when the subscription is renewed.
+    renewal_ordinal: int
+        Proleptic Gregorian ordinal of ``renewal_date``, precomputed so due
+        checks compare plain integers instead of ``datetime.date`` objects.
+        Kept in sync with ``renewal_date`` by ``renew``.
     active: bool
         Whether the subscription is currently active. Inactive subscriptions
         are considered cancelled.
+
+    The class uses ``__slots__`` rather than ``@dataclass``: it avoids the
+    per-instance ``__dict__`` (instances are several times smaller, which
+    keeps the aggregation sweeps cache-friendly) and skips the dataclass
+    machinery at import time.
     """
 
-    name: str
-    cost: float
-    renewal_date: datetime.date
-    active: bool = True
+    __slots__ = ("name", "cost", "renewal_date", "renewal_ordinal", "active")
+
+    def __init__(
+        self,
+        name: str,
+        cost: float,
+        renewal_date: datetime.date,
+        active: bool = True,
+    ) -> None:
+        self.name = name
+        self.cost = cost
+        self.renewal_date = renewal_date
+        self.renewal_ordinal = renewal_date.toordinal()
+        self.active = active
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, cost={self.cost!r}, "
+            f"renewal_date={self.renewal_date!r}, active={self.active!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # Compare by field value like the @dataclass this class replaced;
+        # renewal_ordinal is derived from renewal_date and excluded.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.name, self.cost, self.renewal_date, self.active) == (
+            other.name,
+            other.cost,
+            other.renewal_date,
+            other.active,
+        )
+
+    # Unfrozen dataclasses with eq=True are unhashable; keep that contract.
+    __hash__ = None
 
     def cancel(self) -> None:
         """Cancel this subscription.
@@ -76,20 +124,75 @@ class Subscription:
         self.active = True
         # Set the renewal date 30 days ahead of today. In practice months
         # vary in length but this approximation simplifies the logic.
-        self.renewal_date = today + datetime.timedelta(days=30)
+        self.renewal_date = today + _ONE_MONTH
+        self.renewal_ordinal = today.toordinal() + _ONE_MONTH_DAYS
 
 
 class SubscriptionManager:
     """Manages a collection of subscriptions.
 
-    The manager stores subscriptions in a dictionary keyed by name and
-    exposes methods to add, remove, cancel and renew subscriptions. It also
-    provides reporting capabilities for active and cancelled subscriptions
-    and computes total costs and savings.
+    The manager stores subscriptions in struct-of-arrays form: the fields
+    consulted by the hot aggregation paths (cost, renewal ordinal, active
+    flag) live in parallel columns indexed by row number, with a
+    ``name -> row`` dictionary for O(1) lookups. The ``Subscription``
+    objects themselves are kept in a parallel list so lookups and listings
+    hand back the same objects callers added. Totals and the automatic
+    cancellation sweep read the contiguous columns instead of chasing
+    per-object attributes.
+
+    State changes (cancel, renew, remove) must go through the manager so
+    the columns stay in sync with the ``Subscription`` objects; mutating a
+    managed subscription directly leaves the columns stale.
+
+    Aggregate totals are maintained as running sums: every mutation moves
+    the affected cost between the active and cancelled buckets in the same
+    step, so ``total_monthly_cost`` and ``total_savings`` are O(1) reads.
+    The sums are reconciled against the columns every
+    ``_RECONCILE_INTERVAL`` mutations to bound floating-point drift.
+
+    A sorted ``(renewal ordinal, name)`` index over active subscriptions
+    lets the automatic cancellation sweep bisect to the due prefix instead
+    of scanning every row. Entries are never removed eagerly on cancel,
+    removal or renewal; stale entries are detected lazily during the sweep
+    by checking the name and ordinal against the authoritative columns.
     """
 
+    #: Number of mutations between recomputations of the running totals.
+    _RECONCILE_INTERVAL = 1024
+
     def __init__(self) -> None:
-        self._subscriptions: Dict[str, Subscription] = {}
+        self._subs: List[Subscription] = []
+        self._names: List[str] = []
+        self._cost = array("d")
+        self._renewal_ordinal = array("l")
+        self._active = bytearray()
+        self._name_to_idx: Dict[str, int] = {}
+        self._due_index: List[Tuple[int, str]] = []
+        self._active_total = 0.0
+        self._cancelled_total = 0.0
+        self._mutations = 0
+        self._version = 0
+        self._list_cache: Dict[bool, Tuple[int, List[Subscription]]] = {}
+
+    def _note_mutation(self) -> None:
+        """Record a mutation and periodically reconcile the running totals.
+
+        Every mutating method calls this exactly once, so ``_version``
+        advances monotonically and any cached ``list_subscriptions`` result
+        stamped with an older version is invalidated. The running sums
+        accumulate one floating-point rounding error per update;
+        recomputing them from the cost column every ``_RECONCILE_INTERVAL``
+        mutations keeps the drift bounded.
+        """
+        self._version += 1
+        self._mutations += 1
+        if self._mutations >= self._RECONCILE_INTERVAL:
+            self._mutations = 0
+            # Derive the cancelled bucket from the grand total so only
+            # one masked pass over the cost column is needed.
+            grand_total = float(sum(self._cost))
+            self._active_total = float(sum(compress(self._cost, self._active)))
+            self._cancelled_total = grand_total - self._active_total
 
     def add_subscription(self, subscription: Subscription) -> None:
         """Add a subscription to the manager.
@@ -99,28 +202,113 @@ class SubscriptionManager:
         ValueError
             If a subscription with the same name already exists.
         """
-        if subscription.name in self._subscriptions:
-            raise ValueError(f"Subscription '{subscription.name}' already exists.")
-        self._subscriptions[subscription.name] = subscription
+        # Intern the name so later by-name lookups can short-circuit on
+        # pointer equality instead of comparing character by character.
+        name = sys.intern(subscription.name)
+        subscription.name = name
+        idx = len(self._subs)
+        # setdefault probes and inserts in one lookup; it returns the
+        # existing row (always < idx) when the name is already present.
+        if self._name_to_idx.setdefault(name, idx) != idx:
+            raise ValueError(f"Subscription '{name}' already exists.")
+        self._subs.append(subscription)
+        self._names.append(name)
+        self._cost.append(subscription.cost)
+        self._renewal_ordinal.append(subscription.renewal_ordinal)
+        self._active.append(1 if subscription.active else 0)
+        if subscription.active:
+            self._active_total += subscription.cost
+            insort(self._due_index, (subscription.renewal_ordinal, subscription.name))
+        else:
+            self._cancelled_total += subscription.cost
+        self._note_mutation()
+
+    def add_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """Add a batch of subscriptions in one pass.
+
+        Validates the whole batch up front — names must be unique within
+        the batch and disjoint from the existing subscriptions — then
+        bulk-extends the columns and the name index, so the per-row
+        duplicate check and index insertion of repeated
+        ``add_subscription`` calls are replaced by a handful of C-level
+        set and extend operations. The due index is extended once and
+        re-sorted rather than bisect-inserting row by row.
+
+        Raises
+        ------
+        ValueError
+            If any name in the batch is duplicated or already exists. The
+            manager is left unchanged in that case.
+        """
+        subs = list(subscriptions)
+        names = [sys.intern(sub.name) for sub in subs]
+        name_set = set(names)
+        if len(name_set) != len(names):
+            raise ValueError("Duplicate subscription names in batch.")
+        existing = name_set & self._name_to_idx.keys()
+        if existing:
+            raise ValueError(f"Subscription '{min(existing)}' already exists.")
+        base = len(self._subs)
+        self._name_to_idx.update(zip(names, range(base, base + len(subs))))
+        for sub, name in zip(subs, names):
+            sub.name = name
+        self._subs.extend(subs)
+        self._names.extend(names)
+        self._cost.extend(sub.cost for sub in subs)
+        self._renewal_ordinal.extend(sub.renewal_ordinal for sub in subs)
+        self._active.extend(1 if sub.active else 0 for sub in subs)
+        self._active_total += sum(sub.cost for sub in subs if sub.active)
+        self._cancelled_total += sum(sub.cost for sub in subs if not sub.active)
+        self._due_index.extend(
+            (sub.renewal_ordinal, name) for sub, name in zip(subs, names) if sub.active
+        )
+        # Timsort is near-linear on the mostly-sorted result of appending a
+        # batch, and one sort beats len(subs) bisect insertions.
+        self._due_index.sort()
+        self._note_mutation()
 
     def remove_subscription(self, name: str) -> None:
         """Remove a subscription by name.
 
+        Uses swap-and-pop: the last row is moved into the vacated slot so
+        the columns stay contiguous without shifting every later row.
+
         Raises
         ------
         KeyError
             If no subscription with the given name exists.
         """
-        if name not in self._subscriptions:
+        idx = self._name_to_idx.pop(sys.intern(name), None)
+        if idx is None:
             raise KeyError(f"Subscription '{name}' does not exist.")
-        del self._subscriptions[name]
+        if self._active[idx]:
+            self._active_total -= self._cost[idx]
+        else:
+            self._cancelled_total -= self._cost[idx]
+        last = len(self._subs) - 1
+        if idx != last:
+            self._subs[idx] = self._subs[last]
+            self._names[idx] = self._names[last]
+            self._cost[idx] = self._cost[last]
+            self._renewal_ordinal[idx] = self._renewal_ordinal[last]
+            self._active[idx] = self._active[last]
+            self._name_to_idx[self._names[idx]] = idx
+        self._subs.pop()
+        self._names.pop()
+        self._cost.pop()
+        self._renewal_ordinal.pop()
+        self._active.pop()
+        self._note_mutation()
 
     def auto_cancel_subscriptions(self, today: Optional[datetime.date] = None) -> None:
         """Automatically cancel subscriptions due to renew today or earlier.
 
-        Iterates over all active subscriptions and cancels those whose
-        ``renewal_date`` is less than or equal to ``today``. If ``today`` is
-        None the current UTC date is used. Inactive subscriptions are ignored.
+        Bisects the sorted due index to the prefix of entries with renewal
+        ordinal <= ``today``'s ordinal, so only the due subscriptions are
+        visited rather than every row. Stale entries (subscriptions that
+        were removed, cancelled or renewed since the entry was inserted)
+        are skipped and discarded with the rest of the prefix. If ``today``
+        is None the current UTC date is used.
 
         Parameters
         ----------
@@ -129,9 +317,32 @@ class SubscriptionManager:
         """
         if today is None:
             today = datetime.date.today()
-        for sub in list(self._subscriptions.values()):
-            if sub.active and sub.renewal_date <= today:
-                sub.cancel()
+        today_ord = today.toordinal()
+        i = bisect_right(self._due_index, (today_ord, "\U0010ffff"))
+        if i:
+            # Bind loop invariants to locals so the prefix loop dispatches
+            # LOAD_FAST instead of repeated attribute lookups on self.
+            get_idx = self._name_to_idx.get
+            active = self._active
+            ordinals = self._renewal_ordinal
+            subs = self._subs
+            costs = self._cost
+            moved = 0.0
+            # Iterate the due prefix in place rather than slicing out a
+            # copy; cancelling never touches the due index, so iterating
+            # while it is live is safe. The prefix is deleted afterwards.
+            for entry_ord, name in islice(self._due_index, i):
+                # Names in the due index were interned on insertion.
+                idx = get_idx(name)
+                if idx is None or not active[idx] or ordinals[idx] != entry_ord:
+                    continue
+                active[idx] = 0
+                subs[idx].cancel()
+                moved += costs[idx]
+            del self._due_index[:i]
+            self._active_total -= moved
+            self._cancelled_total += moved
+        self._note_mutation()
 
     def renew_subscription(self, name: str, today: Optional[datetime.date] = None) -> None:
         """Renew a cancelled subscription.
@@ -146,9 +357,19 @@ class SubscriptionManager:
         today: datetime.date, optional
             Date used as the basis for renewal. Defaults to ``datetime.date.today()``.
         """
-        if name not in self._subscriptions:
+        idx = self._name_to_idx.get(sys.intern(name))
+        if idx is None:
             raise KeyError(f"Subscription '{name}' does not exist.")
-        self._subscriptions[name].renew(today=today)
+        sub = self._subs[idx]
+        sub.renew(today=today)
+        self._renewal_ordinal[idx] = sub.renewal_ordinal
+        insort(self._due_index, (sub.renewal_ordinal, name))
+        if not self._active[idx]:
+            self._active[idx] = 1
+            cost = self._cost[idx]
+            self._cancelled_total -= cost
+            self._active_total += cost
+        self._note_mutation()
 
     def cancel_subscription(self, name: str) -> None:
         """Manually cancel a subscription by name.
@@ -158,9 +379,16 @@ class SubscriptionManager:
         KeyError
             If no subscription with the given name exists.
         """
-        if name not in self._subscriptions:
+        idx = self._name_to_idx.get(sys.intern(name))
+        if idx is None:
             raise KeyError(f"Subscription '{name}' does not exist.")
-        self._subscriptions[name].cancel()
+        if self._active[idx]:
+            self._active[idx] = 0
+            cost = self._cost[idx]
+            self._active_total -= cost
+            self._cancelled_total += cost
+        self._subs[idx].cancel()
+        self._note_mutation()
 
     def get_subscription(self, name: str) -> Subscription:
         """Return a subscription by name.
@@ -170,13 +398,32 @@ class SubscriptionManager:
         KeyError
             If no subscription with the given name exists.
         """
-        if name not in self._subscriptions:
+        idx = self._name_to_idx.get(sys.intern(name))
+        if idx is None:
             raise KeyError(f"Subscription '{name}' does not exist.")
-        return self._subscriptions[name]
+        return self._subs[idx]
+
+    def _iter_subscriptions(self, active_only: bool = False) -> Iterator[Subscription]:
+        """Iterate over subscriptions without materializing a list.
+
+        Reducers and display loops that only need a single pass should use
+        this instead of ``list_subscriptions``, which allocates an N-sized
+        list per call. The active filter is applied at C level via
+        ``itertools.compress`` over the active column.
+        """
+        if active_only:
+            return compress(self._subs, self._active)
+        return iter(self._subs)
 
     def list_subscriptions(self, active_only: bool = False) -> List[Subscription]:
         """Return a list of all subscriptions.
 
+        Results are memoized per ``active_only`` value and stamped with
+        the mutation version, so repeated calls between mutations return
+        the cached list instead of rebuilding it. Callers should treat
+        the returned list as read-only; the ``Subscription`` objects in
+        it are the live stored instances either way.
+
         Parameters
         ----------
         active_only: bool, optional
@@ -187,13 +434,19 @@ class SubscriptionManager:
         List[Subscription]
             A list of subscriptions filtered by ``active_only``.
         """
-        if active_only:
-            return [sub for sub in self._subscriptions.values() if sub.active]
-        return list(self._subscriptions.values())
+        cached = self._list_cache.get(active_only)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        result = list(self._iter_subscriptions(active_only=active_only))
+        self._list_cache[active_only] = (self._version, result)
+        return result
 
     def total_monthly_cost(self, active_only: bool = True) -> float:
         """Compute the total monthly cost of subscriptions.
 
+        Reads the running sums maintained by the mutation methods, so the
+        cost column is never rescanned: the call is O(1).
+
         Parameters
         ----------
         active_only: bool, optional
@@ -204,8 +457,9 @@ class SubscriptionManager:
         float
             Sum of the monthly cost of the subscriptions.
         """
-        subs = self.list_subscriptions(active_only=active_only)
-        return sum(sub.cost for sub in subs)
+        if active_only:
+            return self._active_total
+        return self._active_total + self._cancelled_total
 
     def total_savings(self) -> float:
         """Compute the monthly cost saved by cancelled subscriptions.
@@ -215,4 +469,4 @@ class SubscriptionManager:
         float
             Sum of the cost of subscriptions that are not active.
         """
-        return sum(sub.cost for sub in self.list_subscriptions() if not sub.active)
+        return self._cancelled_total
@@ -1,17 +1,22 @@
 """Unit tests for the subscription manager package.
 
 These tests verify the core behaviours of the :mod:`subscription_manager`
-package: adding, removing and retrieving subscriptions, automatic
-cancellation when the renewal date is reached, manual cancellation and
-renewal, and summary calculations. Running these tests should give you
-confidence that the underlying logic works as expected. They do not test
-integration with external systems or user interfaces.
+package: adding, removing and retrieving subscriptions (singly and in
+batches), automatic cancellation when the renewal date is reached, manual
+cancellation and renewal, summary calculations, and the non-interactive
+pieces of the CLI (date parsing and CSV import). Running these tests
+should give you confidence that the underlying logic works as expected.
+They do not test integration with external systems or the interactive
+prompts.
 """
 
 import datetime
+import os
+import tempfile
 import unittest
 
 from subscription_manager import Subscription, SubscriptionManager
+from subscription_manager.cli import import_csv, parse_date
 
 
 class TestSubscription(unittest.TestCase):
@@ -57,6 +62,27 @@ class TestSubscriptionManager(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.manager.remove_subscription("Amazon")
 
+    def test_remove_middle_subscription_swaps_last_row(self) -> None:
+        # Removing a middle row exercises the swap-and-pop branch: the last
+        # row is moved into the vacated slot and every column plus the name
+        # index must stay consistent.
+        past_date = self.today - datetime.timedelta(days=1)
+        future_date = self.today + datetime.timedelta(days=10)
+        self.manager.add_subscription(Subscription(name="First", cost=1.0, renewal_date=future_date))
+        self.manager.add_subscription(Subscription(name="Middle", cost=2.0, renewal_date=future_date))
+        self.manager.add_subscription(Subscription(name="Last", cost=4.0, renewal_date=past_date))
+        self.manager.remove_subscription("Middle")
+        with self.assertRaises(KeyError):
+            self.manager.get_subscription("Middle")
+        self.assertEqual(self.manager.get_subscription("First").cost, 1.0)
+        self.assertEqual(self.manager.get_subscription("Last").cost, 4.0)
+        self.assertEqual(self.manager.total_monthly_cost(), 5.0)
+        # The swapped row must still be found by a sweep via the name index
+        self.manager.auto_cancel_subscriptions(today=self.today)
+        self.assertFalse(self.manager.get_subscription("Last").active)
+        self.assertTrue(self.manager.get_subscription("First").active)
+        self.assertEqual(self.manager.total_savings(), 4.0)
+
     def test_auto_cancel_subscriptions(self) -> None:
         past_date = self.today - datetime.timedelta(days=1)
         future_date = self.today + datetime.timedelta(days=1)
@@ -69,6 +95,44 @@ class TestSubscriptionManager(unittest.TestCase):
         self.assertFalse(self.manager.get_subscription("PastService").active)
         self.assertTrue(self.manager.get_subscription("FutureService").active)
 
+    def test_auto_cancel_skips_entry_for_removed_subscription(self) -> None:
+        # A due-index entry whose subscription was removed is stale and
+        # must be discarded by the sweep without touching anything else.
+        past_date = self.today - datetime.timedelta(days=1)
+        future_date = self.today + datetime.timedelta(days=10)
+        self.manager.add_subscription(Subscription(name="Gone", cost=5.0, renewal_date=past_date))
+        self.manager.add_subscription(Subscription(name="Stays", cost=7.0, renewal_date=future_date))
+        self.manager.remove_subscription("Gone")
+        self.manager.auto_cancel_subscriptions(today=self.today)
+        self.assertTrue(self.manager.get_subscription("Stays").active)
+        self.assertEqual(self.manager.total_savings(), 0.0)
+        self.assertEqual(self.manager.total_monthly_cost(), 7.0)
+
+    def test_auto_cancel_skips_entry_for_manually_cancelled_subscription(self) -> None:
+        # Manual cancellation leaves its due-index entry behind; the sweep
+        # must skip it rather than move the cost a second time.
+        past_date = self.today - datetime.timedelta(days=1)
+        self.manager.add_subscription(Subscription(name="Manual", cost=5.0, renewal_date=past_date))
+        self.manager.cancel_subscription("Manual")
+        self.assertEqual(self.manager.total_savings(), 5.0)
+        self.manager.auto_cancel_subscriptions(today=self.today)
+        self.assertEqual(self.manager.total_savings(), 5.0)
+        self.assertEqual(self.manager.total_monthly_cost(), 0.0)
+
+    def test_auto_cancel_skips_stale_entry_after_renew(self) -> None:
+        # Renewing re-inserts the subscription with its new ordinal; the
+        # old entry's ordinal no longer matches and a sweep at the old
+        # date must leave the subscription active.
+        past_date = self.today - datetime.timedelta(days=1)
+        self.manager.add_subscription(Subscription(name="Renewed", cost=5.0, renewal_date=past_date))
+        self.manager.cancel_subscription("Renewed")
+        self.manager.renew_subscription("Renewed", today=self.today)
+        self.manager.auto_cancel_subscriptions(today=self.today)
+        self.assertTrue(self.manager.get_subscription("Renewed").active)
+        # At the new renewal date the fresh entry must still fire
+        self.manager.auto_cancel_subscriptions(today=self.today + datetime.timedelta(days=30))
+        self.assertFalse(self.manager.get_subscription("Renewed").active)
+
     def test_renew_subscription(self) -> None:
         past_date = self.today - datetime.timedelta(days=1)
         sub = Subscription(name="OldService", cost=7.0, renewal_date=past_date)
@@ -82,6 +146,56 @@ class TestSubscriptionManager(unittest.TestCase):
         expected_date = self.today + datetime.timedelta(days=30)
         self.assertEqual(sub.renewal_date, expected_date)
 
+    def test_add_many(self) -> None:
+        past_date = self.today - datetime.timedelta(days=1)
+        future_date = self.today + datetime.timedelta(days=10)
+        self.manager.add_many(
+            [
+                Subscription(name="Due", cost=5.0, renewal_date=past_date),
+                Subscription(name="NotDue", cost=7.5, renewal_date=future_date),
+            ]
+        )
+        self.assertEqual(self.manager.total_monthly_cost(), 12.5)
+        # The batch must feed the due index: a sweep should cancel only the due one
+        self.manager.auto_cancel_subscriptions(today=self.today)
+        self.assertFalse(self.manager.get_subscription("Due").active)
+        self.assertTrue(self.manager.get_subscription("NotDue").active)
+        self.assertEqual(self.manager.total_savings(), 5.0)
+
+    def test_add_many_duplicate_within_batch(self) -> None:
+        batch = [
+            Subscription(name="Dup", cost=1.0, renewal_date=self.today),
+            Subscription(name="Dup", cost=2.0, renewal_date=self.today),
+        ]
+        with self.assertRaises(ValueError):
+            self.manager.add_many(batch)
+        # The failed batch must leave the manager unchanged
+        self.assertEqual(self.manager.list_subscriptions(), [])
+        self.assertEqual(self.manager.total_monthly_cost(active_only=False), 0.0)
+
+    def test_add_many_name_collides_with_existing(self) -> None:
+        self.manager.add_subscription(Subscription(name="Existing", cost=3.0, renewal_date=self.today))
+        batch = [
+            Subscription(name="New", cost=1.0, renewal_date=self.today),
+            Subscription(name="Existing", cost=2.0, renewal_date=self.today),
+        ]
+        with self.assertRaises(ValueError):
+            self.manager.add_many(batch)
+        # Nothing from the batch may have been added, not even the new name
+        self.assertEqual(len(self.manager.list_subscriptions()), 1)
+        with self.assertRaises(KeyError):
+            self.manager.get_subscription("New")
+        self.assertEqual(self.manager.total_monthly_cost(active_only=False), 3.0)
+
+    def test_list_subscriptions_active_only(self) -> None:
+        active = Subscription(name="Active", cost=5.0, renewal_date=self.today + datetime.timedelta(days=10))
+        cancelled = Subscription(name="Cancelled", cost=5.0, renewal_date=self.today)
+        self.manager.add_subscription(active)
+        self.manager.add_subscription(cancelled)
+        self.manager.cancel_subscription("Cancelled")
+        self.assertEqual(self.manager.list_subscriptions(active_only=True), [active])
+        self.assertCountEqual(self.manager.list_subscriptions(), [active, cancelled])
+
     def test_total_cost_and_savings(self) -> None:
         past_date = self.today - datetime.timedelta(days=1)
         sub1 = Subscription(name="Cancelled", cost=10.0, renewal_date=past_date)
@@ -98,5 +212,58 @@ class TestSubscriptionManager(unittest.TestCase):
         self.assertEqual(savings, 10.0)
 
 
+class TestParseDate(unittest.TestCase):
+    def test_parses_iso_dates(self) -> None:
+        self.assertEqual(parse_date("2025-01-31"), datetime.date(2025, 1, 31))
+        self.assertEqual(parse_date("0001-12-01"), datetime.date(1, 12, 1))
+
+    def test_rejects_malformed_dates(self) -> None:
+        bad_inputs = [
+            "",
+            "2025/01/31",
+            "2025-1-31",
+            "20250131",
+            "2025-01-31 ",
+            " 025-01-31",
+            "+025-01-31",
+            "2025-+1-31",
+            "2025-01-3a",
+            "2025-13-01",
+            "2025-02-30",
+        ]
+        for bad in bad_inputs:
+            with self.assertRaises(ValueError, msg=bad):
+                parse_date(bad)
+
+
+class TestImportCsv(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = SubscriptionManager()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "subs.csv")
+
+    def _write(self, content: str) -> None:
+        with open(self.path, "w", newline="") as handle:
+            handle.write(content)
+
+    def test_import_csv_round_trip(self) -> None:
+        # Blank rows are skipped; the others are parsed and added
+        self._write("Netflix,15.0,2025-02-01\n\nHulu,12.0,2025-03-01\n")
+        count = import_csv(self.manager, self.path)
+        self.assertEqual(count, 2)
+        self.assertEqual(self.manager.total_monthly_cost(), 27.0)
+        netflix = self.manager.get_subscription("Netflix")
+        self.assertEqual(netflix.renewal_date, datetime.date(2025, 2, 1))
+        self.assertTrue(netflix.active)
+
+    def test_import_csv_malformed_row(self) -> None:
+        self._write("Netflix,15.0,2025-02-01\nHulu,12.0\n")
+        with self.assertRaises(ValueError):
+            import_csv(self.manager, self.path)
+        # A failing import must leave the manager unchanged
+        self.assertEqual(self.manager.list_subscriptions(), [])
+
+
 if __name__ == "__main__":
     unittest.main()